@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+import atexit
 from copy import copy
 
 from pm4py.algo.conformance.alignments.petri_net import variants
@@ -56,6 +57,7 @@ class Parameters(Enum):
     CASE_ID_KEY = PARAMETER_CONSTANT_CASEID_KEY
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
+    VARIANTS_PRECOMPUTED = "variants_precomputed"
     SHOW_PROGRESS_BAR = "show_progress_bar"
     CORES = 'cores'
     BEST_WORST_COST_INTERNAL = "best_worst_cost_internal"
@@ -77,6 +79,30 @@ VERSION_DISCOUNTED_A_STAR = Variants.VERSION_DISCOUNTED_A_STAR
 VERSIONS = {Variants.VERSION_DIJKSTRA_NO_HEURISTICS, Variants.VERSION_DIJKSTRA_NO_HEURISTICS,
             Variants.VERSION_DIJKSTRA_LESS_MEMORY,VERSION_DISCOUNTED_A_STAR}
 
+_executor_cache = {}
+
+
+def __get_executor(num_cores):
+    """
+    Returns the shared process pool executor with the given number of workers,
+    creating it on the first use; reusing the pool across calls avoids paying
+    the pool startup cost on every invocation of the multiprocessing alignments.
+    """
+    executor = _executor_cache.get(num_cores)
+    if executor is not None and getattr(executor, "_broken", False):
+        # a dead worker (e.g. killed by the OS) leaves the pool permanently
+        # broken; evict it so a fresh pool is created instead of raising
+        # BrokenProcessPool on every subsequent call
+        executor.shutdown(wait=False)
+        _executor_cache.pop(num_cores, None)
+        executor = None
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=num_cores)
+        atexit.register(executor.shutdown)
+        _executor_cache[num_cores] = executor
+    return executor
+
 
 def apply(obj: Union[EventLog, EventStream, pd.DataFrame, Trace], petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, parameters: Optional[Dict[Any, Any]] = None, variant=DEFAULT_VARIANT) -> Union[typing.AlignmentResult, typing.ListAlignments]:
     if parameters is None:
@@ -255,29 +281,32 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
 
     best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
     variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
+    # the precomputed variants have been consumed at this point; drop them so
+    # the list is not pickled again with the parameters of every submitted trace
+    parameters.pop(Parameters.VARIANTS_PRECOMPUTED, None)
+    parameters.pop(Parameters.VARIANTS_PRECOMPUTED.value, None)
     parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
     all_alignments = []
 
-    from concurrent.futures import ProcessPoolExecutor
-    with ProcessPoolExecutor(max_workers=num_cores) as executor:
-        futures = []
-        for trace in one_tr_per_var:
-            futures.append(executor.submit(apply_trace, trace, petri_net, initial_marking, final_marking, parameters))
-        progress = __get_progress_bar(len(one_tr_per_var), parameters)
-        if progress is not None:
-            alignments_ready = 0
-            while alignments_ready != len(futures):
-                current = 0
-                for index, variant in enumerate(futures):
-                    current = current + 1 if futures[index].done() else current
-                if current > alignments_ready:
-                    for i in range(0, current - alignments_ready):
-                        progress.update()
-                alignments_ready = current
-        for index, variant in enumerate(futures):
-            all_alignments.append(futures[index].result())
-        __close_progress_bar(progress)
+    executor = __get_executor(num_cores)
+    futures = []
+    for trace in one_tr_per_var:
+        futures.append(executor.submit(apply_trace, trace, petri_net, initial_marking, final_marking, parameters))
+    progress = __get_progress_bar(len(one_tr_per_var), parameters)
+    if progress is not None:
+        alignments_ready = 0
+        while alignments_ready != len(futures):
+            current = 0
+            for index, variant in enumerate(futures):
+                current = current + 1 if futures[index].done() else current
+            if current > alignments_ready:
+                for i in range(0, current - alignments_ready):
+                    progress.update()
+            alignments_ready = current
+    for index, variant in enumerate(futures):
+        all_alignments.append(futures[index].result())
+    __close_progress_bar(progress)
 
     alignments = __form_alignments(variants_idxs, all_alignments)
 
@@ -303,8 +332,10 @@ def __get_variants_structure(log, parameters):
     one_tr_per_var = []
 
     if type(log) is pd.DataFrame:
-        case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
-        traces = list(log.groupby(case_id_key)[activity_key].apply(tuple))
+        traces = exec_utils.get_param_value(Parameters.VARIANTS_PRECOMPUTED, parameters, None)
+        if traces is None:
+            case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+            traces = list(log.groupby(case_id_key)[activity_key].apply(tuple))
         for idx, trace in enumerate(traces):
             if trace not in variants_idxs:
                 variants_idxs[trace] = [idx]
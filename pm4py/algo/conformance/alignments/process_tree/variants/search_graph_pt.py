@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+import atexit
 import copy
 import heapq
 import pkgutil
@@ -43,6 +44,31 @@ class Parameters(Enum):
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
 
 
+_executor_cache = {}
+
+
+def _get_executor(num_cores):
+    """
+    Returns the shared process pool executor with the given number of workers,
+    creating it on the first use; reusing the pool across calls avoids paying
+    the pool startup cost on every invocation of the multiprocessing alignments.
+    """
+    executor = _executor_cache.get(num_cores)
+    if executor is not None and getattr(executor, "_broken", False):
+        # a dead worker (e.g. killed by the OS) leaves the pool permanently
+        # broken; evict it so a fresh pool is created instead of raising
+        # BrokenProcessPool on every subsequent call
+        executor.shutdown(wait=False)
+        _executor_cache.pop(num_cores, None)
+        executor = None
+    if executor is None:
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=num_cores)
+        atexit.register(executor.shutdown)
+        _executor_cache[num_cores] = executor
+    return executor
+
+
 class SGASearchState:
     def __init__(self, costs: float, index: int, state: pt_sem.ProcessTreeState,
                  leaves: Optional[List[ProcessTree]] = None,
@@ -314,46 +340,45 @@ def apply_multiprocessing(obj: Union[EventLog, Trace, pd.DataFrame], pt: Process
         variant = tuple(x[activity_key] for x in obj)
         return align_variant(variant, leaves, pt)
     else:
-        from concurrent.futures import ProcessPoolExecutor
+        executor = _get_executor(num_cores)
 
-        with ProcessPoolExecutor(max_workers=num_cores) as executor:
-            ret = []
-            best_worst_cost = align_variant([], leaves, pt)["cost"]
-            futures = {}
-            align_dict = {}
-
-            if type(obj) is pd.DataFrame:
-                case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters,
-                                                         constants.CASE_CONCEPT_NAME)
-                traces = list(obj.groupby(case_id_key)[activity_key].apply(tuple))
-            else:
-                obj = log_converter.apply(obj, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
-                traces = [tuple(x[activity_key] for x in case) for case in obj]
+        ret = []
+        best_worst_cost = align_variant([], leaves, pt)["cost"]
+        futures = {}
+        align_dict = {}
 
-            for trace in traces:
-                if trace not in futures:
-                    futures[trace] = executor.submit(align_variant, trace, leaves, pt)
+        if type(obj) is pd.DataFrame:
+            case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters,
+                                                     constants.CASE_CONCEPT_NAME)
+            traces = list(obj.groupby(case_id_key)[activity_key].apply(tuple))
+        else:
+            obj = log_converter.apply(obj, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
+            traces = [tuple(x[activity_key] for x in case) for case in obj]
 
-            progress = _construct_progress_bar(len(futures), parameters)
-            alignments_ready = 0
-            if progress is not None:
-                while alignments_ready != len(futures):
-                    current = 0
-                    for variant in futures:
-                        current = current + 1 if futures[variant].done() else current
-                    if current > alignments_ready:
-                        for i in range(0, current - alignments_ready):
-                            progress.update()
-                    alignments_ready = current
-
-            for variant in traces:
-                if variant not in align_dict:
-                    al = futures[variant].result()
-                    ltrace_bwc = len(trace) + best_worst_cost
-                    al["fitness"] = 1.0 - al["cost"] / ltrace_bwc if ltrace_bwc > 0 else 0.0
-                    align_dict[variant] = al
-                ret.append(align_dict[variant])
-            _destroy_progress_bar(progress)
+        for trace in traces:
+            if trace not in futures:
+                futures[trace] = executor.submit(align_variant, trace, leaves, pt)
+
+        progress = _construct_progress_bar(len(futures), parameters)
+        alignments_ready = 0
+        if progress is not None:
+            while alignments_ready != len(futures):
+                current = 0
+                for variant in futures:
+                    current = current + 1 if futures[variant].done() else current
+                if current > alignments_ready:
+                    for i in range(0, current - alignments_ready):
+                        progress.update()
+                alignments_ready = current
+
+        for variant in traces:
+            if variant not in align_dict:
+                al = futures[variant].result()
+                ltrace_bwc = len(variant) + best_worst_cost
+                al["fitness"] = 1.0 - al["cost"] / ltrace_bwc if ltrace_bwc > 0 else 0.0
+                align_dict[variant] = al
+            ret.append(align_dict[variant])
+        _destroy_progress_bar(progress)
         return ret
 
 
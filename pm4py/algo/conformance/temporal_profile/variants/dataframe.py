@@ -18,6 +18,7 @@ import sys
 from enum import Enum
 from typing import Optional, Dict, Any
 
+import numpy as np
 import pandas as pd
 
 from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
@@ -89,6 +90,7 @@ def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
                                      temporal_profile.items()])
 
     cases = list(df[case_id_key].unique())
+    case_indices = {c: i for i, c in enumerate(cases)}
     ret = [[] for c in cases]
     efg = get_partial_order_dataframe(df, activity_key=activity_key, timestamp_key=timestamp_key,
                                       start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
@@ -97,11 +99,12 @@ def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
     efg = efg[[case_id_key, activity_key, activity_key + "_2", "@@flow_time"]]
     efg = efg.merge(temporal_profile, on=[activity_key, activity_key + "_2"])
     efg = efg[(efg["@@flow_time"] < efg["@@min"]) | (efg["@@flow_time"] > efg["@@max"])][
-        [case_id_key, activity_key, activity_key + "_2", "@@flow_time", "@@mean", "@@std"]].to_dict("records")
+        [case_id_key, activity_key, activity_key + "_2", "@@flow_time", "@@mean", "@@std"]].copy()
+    efg["@@this_zeta"] = np.where(efg["@@std"] > 0,
+                                  (efg["@@flow_time"] - efg["@@mean"]).abs() / efg["@@std"], sys.maxsize)
 
-    for el in efg:
-        this_zeta = abs(el["@@flow_time"] - el["@@mean"]) / el["@@std"] if el["@@std"] > 0 else sys.maxsize
-        ret[cases.index(el[case_id_key])].append(
-            (el[activity_key], el[activity_key + "_2"], el["@@flow_time"], this_zeta))
+    for el in efg.to_dict("records"):
+        ret[case_indices[el[case_id_key]]].append(
+            (el[activity_key], el[activity_key + "_2"], el["@@flow_time"], el["@@this_zeta"]))
 
     return ret
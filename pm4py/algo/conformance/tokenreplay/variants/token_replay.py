@@ -53,6 +53,7 @@ class Parameters(Enum):
     CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS = "consider_activities_not_in_model_in_fitness"
     ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
     SHOW_PROGRESS_BAR = "show_progress_bar"
+    VARIANTS_PRECOMPUTED = "variants_precomputed"
 
 
 class TechnicalParameters(Enum):
@@ -78,6 +79,131 @@ class NoConceptNameException(Exception):
         self.message = message
 
 
+if pkgutil.find_loader("numba"):
+    from numba import njit
+
+    @njit(cache=True)
+    def _replay_trace_njit(events, indptr_pre, idx_pre, indptr_post, idx_post, im_vec, fm_vec):
+        """
+        Replays a trace (encoded as int32 transition identifiers) against the preset/postset
+        of the transitions (encoded as CSR-style int32 arrays), mirroring the token counts of
+        the pure Python replay for nets without hidden transitions and with unit arc weights.
+        """
+        marking = im_vec.copy()
+        missing = 0
+        consumed = 0
+        produced = 0
+        for i in range(im_vec.shape[0]):
+            produced += im_vec[i]
+        for k in range(events.shape[0]):
+            t = events[k]
+            for j in range(indptr_pre[t], indptr_pre[t + 1]):
+                p = idx_pre[j]
+                if marking[p] < 1:
+                    missing += 1
+                    marking[p] = 1
+                marking[p] -= 1
+                consumed += 1
+            for j in range(indptr_post[t], indptr_post[t + 1]):
+                marking[idx_post[j]] += 1
+                produced += 1
+        remaining = 0
+        for i in range(marking.shape[0]):
+            diff = marking[i] - fm_vec[i]
+            if diff > 0:
+                remaining += diff
+            else:
+                missing += -diff
+            consumed += fm_vec[i]
+        return missing, consumed, remaining, produced
+else:
+    _replay_trace_njit = None
+
+
+def __build_njit_replay_structures(net, initial_marking, final_marking, trans_map):
+    """
+    Builds the int32 array encoding of the net consumed by _replay_trace_njit.
+    Returns None (falling back to the pure Python replay) if Numba is not available
+    or the net is outside the scope of the kernel (hidden transitions, duplicate
+    labels or non-unit arc weights).
+    """
+    if _replay_trace_njit is None:
+        return None
+    if None in trans_map or len(trans_map) != len(net.transitions):
+        return None
+
+    import numpy as np
+
+    places = list(net.places)
+    place_idx = {p: i for i, p in enumerate(places)}
+    transitions = list(net.transitions)
+
+    indptr_pre = [0]
+    idx_pre = []
+    indptr_post = [0]
+    idx_post = []
+    for t in transitions:
+        for a in t.in_arcs:
+            if a.weight != 1:
+                return None
+            idx_pre.append(place_idx[a.source])
+        indptr_pre.append(len(idx_pre))
+        for a in t.out_arcs:
+            if a.weight != 1:
+                return None
+            idx_post.append(place_idx[a.target])
+        indptr_post.append(len(idx_post))
+
+    im_vec = np.zeros(len(places), dtype=np.int32)
+    for p, count in initial_marking.items():
+        im_vec[place_idx[p]] = count
+    fm_vec = np.zeros(len(places), dtype=np.int32)
+    for p, count in final_marking.items():
+        fm_vec[place_idx[p]] = count
+
+    return {"label_to_tid": {t.label: i for i, t in enumerate(transitions)},
+            "indptr_pre": np.asarray(indptr_pre, dtype=np.int32),
+            "idx_pre": np.asarray(idx_pre, dtype=np.int32),
+            "indptr_post": np.asarray(indptr_post, dtype=np.int32),
+            "idx_post": np.asarray(idx_post, dtype=np.int32),
+            "im_vec": im_vec, "fm_vec": fm_vec,
+            "enabled_in_fm": align_utils.get_visible_transitions_eventually_enabled_by_marking(net, final_marking)}
+
+
+def __apply_njit_replay(variant, structures, final_marking, trans_map):
+    """
+    Replays a variant through the Numba kernel. Only perfectly fitting variants are
+    resolved here (their full diagnostics are determined by the variant itself);
+    everything else returns None and goes through the pure Python replay.
+    """
+    import numpy as np
+
+    label_to_tid = structures["label_to_tid"]
+    events = np.empty(len(variant), dtype=np.int32)
+    for i, act in enumerate(variant):
+        if act not in label_to_tid:
+            return None
+        events[i] = label_to_tid[act]
+
+    missing, consumed, remaining, produced = _replay_trace_njit(
+        events, structures["indptr_pre"], structures["idx_pre"], structures["indptr_post"],
+        structures["idx_post"], structures["im_vec"], structures["fm_vec"])
+
+    if missing > 0 or remaining > 0:
+        return None
+
+    return {"trace_is_fit": True,
+            "trace_fitness": 1.0,
+            "activated_transitions": [trans_map[act] for act in variant],
+            "reached_marking": copy(final_marking),
+            "enabled_transitions_in_marking": set(structures["enabled_in_fm"]),
+            "transitions_with_problems": [],
+            "missing_tokens": 0,
+            "consumed_tokens": int(consumed),
+            "remaining_tokens": 0,
+            "produced_tokens": int(produced)}
+
+
 def add_missing_tokens(t, marking):
     """
     Adds missing tokens needed to activate a transition
@@ -914,12 +1040,26 @@ def get_variant_from_trace(trace, activity_key, disable_variants=False):
     return variants_util.get_variant_from_trace(trace, parameters=parameters)
 
 
+def __convert_results_to_names(result):
+    """
+    Replaces the object pointers contained in a replay result by the
+    corresponding names/labels (in place)
+    """
+    result["activated_transitions_labels"] = [x.label for x in result["activated_transitions"]]
+    result["activated_transitions"] = [x.name for x in result["activated_transitions"]]
+    result["enabled_transitions_in_marking_labels"] = [x.label for x in result["enabled_transitions_in_marking"]]
+    result["enabled_transitions_in_marking"] = [x.name for x in result["enabled_transitions_in_marking"]]
+    result["transitions_with_problems"] = [x.name for x in result["transitions_with_problems"]]
+    result["reached_marking"] = {x.name: y for x, y in result["reached_marking"].items()}
+
+
 def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=False, consider_remaining_in_fitness=False,
               activity_key="concept:name", reach_mark_through_hidden=True, stop_immediately_unfit=False,
               walk_through_hidden_trans=True, places_shortest_path_by_hidden=None,
               is_reduction=False, thread_maximum_ex_time=TechnicalParameters.MAX_DEF_THR_EX_TIME.value,
               cleaning_token_flood=False, disable_variants=False, return_object_names=False, show_progress_bar=True,
-              consider_activities_not_in_model_in_fitness=False, case_id_key=constants.CASE_CONCEPT_NAME):
+              consider_activities_not_in_model_in_fitness=False, case_id_key=constants.CASE_CONCEPT_NAME,
+              variants_precomputed=None):
     """
     Apply token-based replay to a log
 
@@ -957,6 +1097,8 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
         Disable variants grouping
     return_object_names
         Decides whether names instead of object pointers shall be returned
+    variants_precomputed
+        Per-case tuples of activities already grouped by the caller (dataframes only)
     """
     post_fix_cache = PostFixCaching()
     marking_to_activity_cache = MarkingToActivityCaching()
@@ -988,8 +1130,15 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
     for t in net.transitions:
         trans_map[t.label] = t
 
+    njit_structures = None
+    if not enable_pltr_fitness and not cleaning_token_flood and not is_reduction:
+        njit_structures = __build_njit_replay_structures(net, initial_marking, final_marking, trans_map)
+
     if type(log) is pd.DataFrame:
-        traces = list(log.groupby(case_id_key)[activity_key].apply(tuple))
+        if variants_precomputed is not None:
+            traces = variants_precomputed
+        else:
+            traces = list(log.groupby(case_id_key)[activity_key].apply(tuple))
     else:
         traces = [tuple(x[activity_key] for x in trace) for trace in log]
 
@@ -1008,6 +1157,17 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
 
     for i in range(len(vc)):
         variant = vc[i][0]
+
+        if njit_structures is not None:
+            fast_result = __apply_njit_replay(variant, njit_structures, final_marking, trans_map)
+            if fast_result is not None:
+                threads_results[variant] = fast_result
+                if progress is not None:
+                    progress.update()
+                if return_object_names:
+                    __convert_results_to_names(threads_results[variant])
+                continue
+
         considered_case = variants_util.variant_to_trace(variant, parameters={constants.PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key})
 
         threads[variant] = ApplyTraceTokenReplay(considered_case, net, initial_marking, final_marking,
@@ -1046,23 +1206,7 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
                                     "produced_tokens": int(t.produced)}
 
         if return_object_names:
-            threads_results[variant]["activated_transitions_labels"] = [x.label for x in
-                                                                        threads_results[variant][
-                                                                            "activated_transitions"]]
-            threads_results[variant]["activated_transitions"] = [x.name for x in threads_results[variant][
-                "activated_transitions"]]
-            threads_results[variant]["enabled_transitions_in_marking_labels"] = [x.label for x in
-                                                                                 threads_results[variant][
-                                                                                     "enabled_transitions_in_marking"]]
-            threads_results[variant]["enabled_transitions_in_marking"] = [x.name for x in
-                                                                          threads_results[variant][
-                                                                              "enabled_transitions_in_marking"]]
-            threads_results[variant]["transitions_with_problems"] = [x.name for x in
-                                                                     threads_results[variant][
-                                                                         "transitions_with_problems"]]
-            threads_results[variant]["reached_marking"] = {x.name: y for x, y in
-                                                           threads_results[variant][
-                                                               "reached_marking"].items()}
+            __convert_results_to_names(threads_results[variant])
         del threads[variant]
 
     for trace_variant in traces:
@@ -1122,6 +1266,7 @@ def apply(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking:
 
     show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters, True)
     case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    variants_precomputed = exec_utils.get_param_value(Parameters.VARIANTS_PRECOMPUTED, parameters, None)
 
     if type(log) is not pd.DataFrame:
         log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
@@ -1136,7 +1281,7 @@ def apply(log: EventLog, net: PetriNet, initial_marking: Marking, final_marking:
                      cleaning_token_flood=cleaning_token_flood, disable_variants=disable_variants,
                      return_object_names=return_names, show_progress_bar=show_progress_bar,
                      consider_activities_not_in_model_in_fitness=consider_activities_not_in_model_in_fitness,
-                     case_id_key=case_id_key)
+                     case_id_key=case_id_key, variants_precomputed=variants_precomputed)
 
 
 def apply_variants_list(variants_list, net, initial_marking, final_marking, parameters=None):
@@ -19,6 +19,8 @@ The ``pm4py.conformance`` module contains the conformance checking algorithms im
 """
 
 import warnings
+import weakref
+from functools import lru_cache
 from typing import List, Dict, Any, Union, Optional, Tuple, Set
 
 from pm4py.objects.log.obj import EventLog, Trace, Event, EventStream
@@ -32,6 +34,113 @@ import pandas as pd
 import deprecation
 
 
+@lru_cache(maxsize=None)
+def __token_replay_algorithm():
+    # the imports inside the entry points are deferred to avoid import cycles;
+    # memoizing them avoids paying the import machinery overhead on every call
+    from pm4py.algo.conformance.tokenreplay import algorithm as token_replay
+    return token_replay
+
+
+@lru_cache(maxsize=None)
+def __petri_alignments_algorithm():
+    from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+    return alignments
+
+
+@lru_cache(maxsize=None)
+def __dfg_alignment_algorithm():
+    from pm4py.algo.conformance.alignments.dfg import algorithm as dfg_alignment
+    return dfg_alignment
+
+
+@lru_cache(maxsize=None)
+def __search_graph_pt_algorithm():
+    from pm4py.algo.conformance.alignments.process_tree.variants import search_graph_pt
+    return search_graph_pt
+
+
+@lru_cache(maxsize=None)
+def __replay_fitness_algorithm():
+    from pm4py.algo.evaluation.replay_fitness import algorithm as replay_fitness
+    return replay_fitness
+
+
+@lru_cache(maxsize=None)
+def __precision_algorithm():
+    from pm4py.algo.evaluation.precision import algorithm as precision_evaluator
+    return precision_evaluator
+
+
+@lru_cache(maxsize=None)
+def __temporal_profile_algorithm():
+    from pm4py.algo.conformance.temporal_profile import algorithm as temporal_profile_conformance
+    return temporal_profile_conformance
+
+
+@lru_cache(maxsize=None)
+def __log_skeleton_algorithm():
+    from pm4py.algo.conformance.log_skeleton import algorithm as log_skeleton_conformance
+    return log_skeleton_conformance
+
+
+_properties_cache = {}
+
+
+def __cached_properties(log, activity_key: str, timestamp_key: str, case_id_key: str) -> Dict[str, Any]:
+    """
+    Caches, per log object and set of keys, the result of get_properties along with
+    the outcome of the dataframe column validation, which are otherwise recomputed
+    by every conformance call against the same log. The cached entry is evicted when
+    the log object is garbage collected; a fresh copy of the properties dictionary
+    is returned at every call, so the cached entry is never mutated.
+    """
+    key = (id(log), activity_key, timestamp_key, case_id_key)
+    cached = _properties_cache.get(key)
+    if cached is None:
+        if check_is_pandas_dataframe(log):
+            check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key,
+                                           case_id_key=case_id_key)
+        cached = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        try:
+            # evict when the log dies, since the id of a dead object can be recycled
+            weakref.finalize(log, _properties_cache.pop, key, None)
+        except TypeError:
+            # the object does not support weak references: return without caching
+            return cached
+        _properties_cache[key] = cached
+    return dict(cached)
+
+
+_variants_cache = {}
+
+
+def __precomputed_variants(log: pd.DataFrame, activity_key: str, case_id_key: str) -> List[tuple]:
+    """
+    Groups a dataframe into the per-case tuples of activities, caching the result per
+    dataframe object so that running several conformance methods on the same dataframe
+    pays the groupby only once. The cached entry is evicted when the dataframe is
+    garbage collected, and recomputed when the number of rows changed, guarding
+    against in-place edits of the dataframe between calls. The resulting list is
+    passed to the downstream algorithms through the parameters, under the
+    variants_precomputed key.
+    """
+    key = (id(log), activity_key, case_id_key)
+    entry = _variants_cache.get(key)
+    if entry is not None and entry[0] == len(log):
+        return entry[1]
+    variants = list(log.groupby(case_id_key)[activity_key].apply(tuple))
+    try:
+        if entry is None:
+            # the finalizer only needs to be registered once per key;
+            # on recomputation the key already carries one
+            weakref.finalize(log, _variants_cache.pop, key, None)
+    except TypeError:
+        return variants
+    _variants_cache[key] = (len(log), variants)
+    return variants
+
+
 def conformance_diagnostics_token_based_replay(log: Union[EventLog, pd.DataFrame], petri_net: PetriNet, initial_marking: Marking,
                                                final_marking: Marking, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> List[Dict[str, Any]]:
     """
@@ -70,15 +179,14 @@ def conformance_diagnostics_token_based_replay(log: Union[EventLog, pd.DataFrame
         net, im, fm = pm4py.discover_petri_net_inductive(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         tbr_diagnostics = pm4py.conformance_diagnostics_token_based_replay(dataframe, net, im, fm, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
+    properties = __cached_properties(log, activity_key, timestamp_key, case_id_key)
     if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        properties["variants_precomputed"] = __precomputed_variants(log, activity_key, case_id_key)
 
-    properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    from pm4py.algo.conformance.tokenreplay import algorithm as token_replay
+    token_replay = __token_replay_algorithm()
     return token_replay.apply(log, petri_net, initial_marking, final_marking, parameters=properties)
 
 
@@ -101,6 +209,9 @@ def conformance_diagnostics_alignments(log: Union[EventLog, pd.DataFrame], *args
     cost: contains the cost of the alignment according to the provided cost function
     fitness: is equal to 1 if the trace is perfectly fitting.
 
+    The alignment is computed only once per variant of the log; the result is then
+    propagated to every trace sharing the same sequence of activities.
+
     :param log: event log
     :param args: specification of the process model
     :param multi_processing: boolean value that enables the multiprocessing
@@ -116,37 +227,36 @@ def conformance_diagnostics_alignments(log: Union[EventLog, pd.DataFrame], *args
         net, im, fm = pm4py.discover_petri_net_inductive(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         alignments_diagnostics = pm4py.conformance_diagnostics_alignments(dataframe, net, im, fm, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
+    properties = __cached_properties(log, activity_key, timestamp_key, case_id_key)
     if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+        properties["variants_precomputed"] = __precomputed_variants(log, activity_key, case_id_key)
 
     if len(args) == 3:
-        if type(args[0]) is PetriNet:
+        if isinstance(args[0], PetriNet):
             # Petri net alignments
-            from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+            alignments = __petri_alignments_algorithm()
             if multi_processing:
                 return alignments.apply_multiprocessing(log, args[0], args[1], args[2], parameters=properties)
             else:
                 return alignments.apply(log, args[0], args[1], args[2], parameters=properties)
         elif isinstance(args[0], dict):
             # DFG alignments
-            from pm4py.algo.conformance.alignments.dfg import algorithm as dfg_alignment
+            dfg_alignment = __dfg_alignment_algorithm()
             return dfg_alignment.apply(log, args[0], args[1], args[2], parameters=properties)
     elif len(args) == 1:
-        if type(args[0]) is ProcessTree:
+        if isinstance(args[0], ProcessTree):
             # process tree alignments
-            from pm4py.algo.conformance.alignments.process_tree.variants import search_graph_pt
+            search_graph_pt = __search_graph_pt_algorithm()
             if multi_processing:
                 return search_graph_pt.apply_multiprocessing(log, args[0], parameters=properties)
             else:
                 return search_graph_pt.apply(log, args[0], parameters=properties)
     # try to convert to Petri net
     import pm4py
-    from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+    alignments = __petri_alignments_algorithm()
     net, im, fm = pm4py.convert_to_petri_net(*args)
     if multi_processing:
         return alignments.apply_multiprocessing(log, net, im, fm, parameters=properties)
@@ -187,15 +297,12 @@ def fitness_token_based_replay(log: Union[EventLog, pd.DataFrame], petri_net: Pe
         net, im, fm = pm4py.discover_petri_net_inductive(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         fitness_tbr = pm4py.fitness_token_based_replay(dataframe, net, im, fm, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
-    if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+    properties = __cached_properties(log, activity_key, timestamp_key, case_id_key)
 
-    from pm4py.algo.evaluation.replay_fitness import algorithm as replay_fitness
+    replay_fitness = __replay_fitness_algorithm()
     return replay_fitness.apply(log, petri_net, initial_marking, final_marking,
                                 variant=replay_fitness.Variants.TOKEN_BASED, parameters=properties)
 
@@ -234,15 +341,12 @@ def fitness_alignments(log: Union[EventLog, pd.DataFrame], petri_net: PetriNet,
         net, im, fm = pm4py.discover_petri_net_inductive(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         fitness_alignments = pm4py.fitness_alignments(dataframe, net, im, fm, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
-    if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    from pm4py.algo.evaluation.replay_fitness import algorithm as replay_fitness
-    parameters = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-    parameters["multiprocessing"] = multi_processing
+    replay_fitness = __replay_fitness_algorithm()
+    parameters = {**__cached_properties(log, activity_key, timestamp_key, case_id_key),
+                  "multiprocessing": multi_processing}
     return replay_fitness.apply(log, petri_net, initial_marking, final_marking,
                                 variant=replay_fitness.Variants.ALIGNMENT_BASED, parameters=parameters)
 
@@ -279,15 +383,12 @@ def precision_token_based_replay(log: Union[EventLog, pd.DataFrame], petri_net:
         net, im, fm = pm4py.discover_petri_net_inductive(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         precision_tbr = pm4py.precision_token_based_replay(dataframe, net, im, fm, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
-    if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+    properties = __cached_properties(log, activity_key, timestamp_key, case_id_key)
 
-    from pm4py.algo.evaluation.precision import algorithm as precision_evaluator
+    precision_evaluator = __precision_algorithm()
     return precision_evaluator.apply(log, petri_net, initial_marking, final_marking,
                                      variant=precision_evaluator.Variants.ETCONFORMANCE_TOKEN, parameters=properties)
 
@@ -327,15 +428,12 @@ def precision_alignments(log: Union[EventLog, pd.DataFrame], petri_net: PetriNet
         net, im, fm = pm4py.discover_petri_net_inductive(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         precision_alignments = pm4py.precision_alignments(dataframe, net, im, fm, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
-    if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    from pm4py.algo.evaluation.precision import algorithm as precision_evaluator
-    parameters = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-    parameters["multiprocessing"] = multi_processing
+    precision_evaluator = __precision_algorithm()
+    parameters = {**__cached_properties(log, activity_key, timestamp_key, case_id_key),
+                  "multiprocessing": multi_processing}
     return precision_evaluator.apply(log, petri_net, initial_marking, final_marking,
                                      variant=precision_evaluator.Variants.ALIGN_ETCONFORMANCE,
                                      parameters=parameters)
@@ -351,7 +449,7 @@ def __convert_to_fp(*args) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     :rtype: ``Union[List[Dict[str, Any]], Dict[str, Any]]``
     """
     import pm4py
-    while type(args) is tuple:
+    while isinstance(args, tuple):
         if len(args) == 1:
             args = args[0]
         else:
@@ -363,6 +461,22 @@ def __convert_to_fp(*args) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     return fp
 
 
+def __footprints_diagnostics(fp1, fp2) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Internal method to compute the footprints conformance diagnostics
+    on already-discovered footprints
+
+    :param fp1: footprints of the event log
+    :param fp2: footprints of the process model
+    :rtype: ``Union[List[Dict[str, Any]], Dict[str, Any]]``
+    """
+    from pm4py.algo.conformance.footprints import algorithm as footprints_conformance
+    if isinstance(fp1, list):
+        return footprints_conformance.apply(fp1, fp2, variant=footprints_conformance.Variants.TRACE_EXTENSIVE)
+    else:
+        return footprints_conformance.apply(fp1, fp2, variant=footprints_conformance.Variants.LOG_EXTENSIVE)
+
+
 @deprecation.deprecated(deprecated_in="2.3.0", removed_in="3.0.0", details="conformance checking using footprints will not be exposed in a future release")
 def conformance_diagnostics_footprints(*args) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
@@ -380,11 +494,7 @@ def conformance_diagnostics_footprints(*args) -> Union[List[Dict[str, Any]], Dic
     """
     fp1 = __convert_to_fp(args[0])
     fp2 = __convert_to_fp(args[1:])
-    from pm4py.algo.conformance.footprints import algorithm as footprints_conformance
-    if isinstance(fp1, list):
-        return footprints_conformance.apply(fp1, fp2, variant=footprints_conformance.Variants.TRACE_EXTENSIVE)
-    else:
-        return footprints_conformance.apply(fp1, fp2, variant=footprints_conformance.Variants.LOG_EXTENSIVE)
+    return __footprints_diagnostics(fp1, fp2)
 
 
 @deprecation.deprecated(deprecated_in="2.3.0", removed_in="3.0.0", details="conformance checking using footprints will not be exposed in a future release")
@@ -404,9 +514,9 @@ def fitness_footprints(*args) -> Dict[str, float]:
         net, im, fm = pm4py.discover_petri_net_inductive(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         fitness_fp = pm4py.fitness_footprints(dataframe, net, im, fm, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    fp_conf = conformance_diagnostics_footprints(*args)
     fp1 = __convert_to_fp(args[0])
     fp2 = __convert_to_fp(args[1:])
+    fp_conf = __footprints_diagnostics(fp1, fp2)
     from pm4py.algo.conformance.footprints.util import evaluation
     return evaluation.fp_fitness(fp1, fp2, fp_conf)
 
@@ -432,6 +542,27 @@ def precision_footprints(*args) -> float:
     return evaluation.fp_precision(fp1, fp2)
 
 
+def __tbr_single_trace(trace, net, im, fm, activity_key=xes_constants.DEFAULT_NAME_KEY) -> Dict[str, Any]:
+    """
+    Internal method to replay a single trace on a Petri net through the
+    token-based replay variant, skipping the log-level validation performed
+    by the public entry point (which dominates the cost of a one-trace replay)
+
+    :param trace: trace
+    :param net: petri net
+    :param im: initial marking
+    :param fm: final marking
+    :param activity_key: attribute to be used as activity
+    :rtype: ``Dict[str, Any]``
+    """
+    from pm4py.algo.conformance.tokenreplay.variants import token_replay
+    log = EventLog()
+    log.append(trace)
+    parameters = {token_replay.Parameters.ACTIVITY_KEY: activity_key,
+                  token_replay.Parameters.SHOW_PROGRESS_BAR: False}
+    return token_replay.apply(log, net, im, fm, parameters=parameters)[0]
+
+
 @deprecation.deprecated(removed_in="2.3.0", deprecated_in="3.0.0", details="this method will be removed in a future release.")
 def __check_is_fit_process_tree(trace, tree) -> bool:
     """
@@ -456,7 +587,7 @@ def __check_is_fit_process_tree(trace, tree) -> bool:
     else:
         from pm4py.convert import convert_to_petri_net
         net, im, fm = convert_to_petri_net(tree)
-        tbr_conf_res = conformance_diagnostics_token_based_replay(log, net, im, fm)[0]
+        tbr_conf_res = __tbr_single_trace(trace, net, im, fm)
         # CHECK 2) if TBR says that is fit, then return True
         # (if they say False, it might be a false negative)
         if tbr_conf_res["trace_is_fit"]:
@@ -482,22 +613,25 @@ def __check_is_fit_petri_net(trace, net, im, fm, activity_key=xes_constants.DEFA
     __event_log_deprecation_warning(trace)
 
     # avoid checking footprints on Petri net (they are too slow)
-    activities_model = set(trans.label for trans in net.transitions if trans.label is not None)
-    activities_trace = set([x[activity_key] for x in trace])
-    diff = activities_trace.difference(activities_model)
-    if diff:
+    # the set of model activities is cached on the net object, since check_is_fitting
+    # is typically called in a loop against the same model
+    activities_model = getattr(net, "_pm4py_label_cache", None)
+    if activities_model is None:
+        activities_model = frozenset(trans.label for trans in net.transitions if trans.label is not None)
+        net._pm4py_label_cache = activities_model
+    if any(x[activity_key] not in activities_model for x in trace):
         # CHECK 1) there are activities in the trace that are not in the model
         return False
     else:
-        log = EventLog()
-        log.append(trace)
-        tbr_conf_res = conformance_diagnostics_token_based_replay(log, net, im, fm)[0]
+        tbr_conf_res = __tbr_single_trace(trace, net, im, fm, activity_key=activity_key)
         # CHECK 2) if TBR says that is fit, then return True
         # (if they say False, it might be a false negative)
         if tbr_conf_res["trace_is_fit"]:
             return True
         else:
             # CHECK 3) alignments definitely say if the trace is fit or not if the previous methods fail
+            log = EventLog()
+            log.append(trace)
             align_conf_res = conformance_diagnostics_alignments(log, net, im, fm)[0]
             return align_conf_res["fitness"] == 1.0
 
@@ -560,16 +694,13 @@ def conformance_temporal_profile(log: Union[EventLog, pd.DataFrame], temporal_pr
         temporal_profile = pm4py.discover_temporal_profile(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         conformance_temporal_profile = pm4py.conformance_temporal_profile(dataframe, temporal_profile, zeta=1, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
-    if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+    properties = __cached_properties(log, activity_key, timestamp_key, case_id_key)
     properties["zeta"] = zeta
 
-    from pm4py.algo.conformance.temporal_profile import algorithm as temporal_profile_conformance
+    temporal_profile_conformance = __temporal_profile_algorithm()
     return temporal_profile_conformance.apply(log, temporal_profile, parameters=properties)
 
 
@@ -611,13 +742,10 @@ def conformance_log_skeleton(log: Union[EventLog, pd.DataFrame], log_skeleton: D
         log_skeleton = pm4py.discover_log_skeleton(dataframe, noise_threshold=0.1, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
         conformance_lsk = pm4py.conformance_log_skeleton(dataframe, log_skeleton, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
-    if type(log) not in [pd.DataFrame, EventLog, EventStream]: raise Exception("the method can be applied only to a traditional event log!")
+    if not isinstance(log, (pd.DataFrame, EventLog, EventStream)): raise Exception("the method can be applied only to a traditional event log!")
     __event_log_deprecation_warning(log)
 
-    if check_is_pandas_dataframe(log):
-        check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+    properties = __cached_properties(log, activity_key, timestamp_key, case_id_key)
 
-    properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    from pm4py.algo.conformance.log_skeleton import algorithm as log_skeleton_conformance
+    log_skeleton_conformance = __log_skeleton_algorithm()
     return log_skeleton_conformance.apply(log, log_skeleton, parameters=properties)
@@ -262,7 +262,11 @@ def __compute_exact_heuristic_new_version(sync_net, a_matrix, h_cvx, g_matrix, c
 
         b_term = matrix(b_term)
 
-    parameters_solving = {"solver": "glpk"}
+    # the problem key allows the LP solver to cache the problem structure
+    # (only the right-hand side changes between the solves on the same sync net);
+    # the net object itself is passed, so the solver can evict the cached model
+    # when the net is garbage collected
+    parameters_solving = {"solver": "glpk", "problem_key": sync_net}
 
     sol = lp_solver.apply(cost_vec, g_matrix, h_cvx, a_matrix, b_term, parameters=parameters_solving,
                           variant=variant)
@@ -15,7 +15,12 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import pkgutil
+import weakref
+from functools import lru_cache
+
 import numpy as np
+from scipy import sparse
 from scipy.optimize import linprog, OptimizeResult
 from typing import Optional, Dict, Any, List
 from enum import Enum
@@ -24,21 +29,174 @@ from pm4py.util import exec_utils
 
 class Parameters:
     INTEGRALITY = "integrality"
+    LP_METHOD = "lp_method"
+    PROBLEM_KEY = "problem_key"
+    MIP_REL_GAP = "mip_rel_gap"
+    TIME_LIMIT = "time_limit"
+
+
+_highs_models_by_key = {}
+
+
+def __to_csr(A):
+    if A is None or sparse.issparse(A):
+        return A
+    return sparse.csr_matrix(A)
+
+
+@lru_cache(maxsize=64)
+def __get_highs_model(c_bytes, a_data_bytes, a_indices_bytes, a_indptr_bytes, num_rows, num_cols):
+    """
+    Builds (and caches) a HiGHS model for the given LP structure (cost vector and
+    CSR-encoded constraint matrix); only the right-hand sides are changed between
+    the solves sharing the same structure.
+    """
+    import highspy
+
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = num_cols
+    lp.num_row_ = num_rows
+    lp.col_cost_ = np.frombuffer(c_bytes, dtype=np.float64)
+    lp.col_lower_ = np.zeros(num_cols, dtype=np.float64)
+    lp.col_upper_ = np.full(num_cols, highspy.kHighsInf, dtype=np.float64)
+    # placeholder bounds, replaced before each solve
+    lp.row_lower_ = np.zeros(num_rows, dtype=np.float64)
+    lp.row_upper_ = np.zeros(num_rows, dtype=np.float64)
+
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+    lp.a_matrix_.start_ = np.frombuffer(a_indptr_bytes, dtype=np.int32)
+    lp.a_matrix_.index_ = np.frombuffer(a_indices_bytes, dtype=np.int32)
+    lp.a_matrix_.value_ = np.frombuffer(a_data_bytes, dtype=np.float64)
+
+    h.passModel(lp)
+    return h
+
 
+def __apply_highspy(c, Aub, bub, Aeq, beq, problem_key=None):
+    """
+    Solves the LP through highspy, reusing the model (and the basis of the
+    previous solve) when the same structure is solved with a different
+    right-hand side, as happens thousands of times during alignments.
+    When a problem_key is provided by the caller (e.g. the synchronous product
+    net object itself), the model is looked up directly under that key,
+    skipping the hashing of the matrix contents; the entry is evicted when the
+    keyed object is garbage collected, so a recycled id cannot alias a
+    different problem of the same shape.
+    """
+    import highspy
 
-def apply(c: list, Aub: np.ndarray, bub: np.matrix, Aeq: np.matrix, beq: np.matrix,
+    c = np.asarray(c, dtype=np.float64).ravel()
+    c_bytes = c.tobytes()
+    num_rows_ub = Aub.shape[0] if Aub is not None else 0
+    num_rows_eq = Aeq.shape[0] if Aeq is not None else 0
+
+    h = None
+    cache_key = None
+    if problem_key is not None:
+        cache_key = (id(problem_key), num_rows_ub, num_rows_eq, len(c))
+        entry = _highs_models_by_key.get(cache_key)
+        if entry is not None and entry[0] == c_bytes:
+            # the costs are fixed at model build time, so a keyed hit is only
+            # valid when the cost vector matches (the same key object may be
+            # solved again with a different cost function)
+            h = entry[1]
+    if h is None:
+        matrix = sparse.vstack([__to_csr(A) for A in (Aub, Aeq) if A is not None], format="csr")
+        h = __get_highs_model(c_bytes, matrix.data.astype(np.float64).tobytes(),
+                              matrix.indices.astype(np.int32).tobytes(),
+                              matrix.indptr.astype(np.int32).tobytes(), matrix.shape[0], matrix.shape[1])
+        if cache_key is not None:
+            try:
+                if cache_key not in _highs_models_by_key:
+                    weakref.finalize(problem_key, _highs_models_by_key.pop, cache_key, None)
+                _highs_models_by_key[cache_key] = (c_bytes, h)
+            except TypeError:
+                # the key object does not support weak references: without the
+                # eviction guarantee the entry is not cached under the key
+                pass
+
+    row_lower = np.empty(num_rows_ub + num_rows_eq, dtype=np.float64)
+    row_upper = np.empty(num_rows_ub + num_rows_eq, dtype=np.float64)
+    if num_rows_ub > 0:
+        row_lower[:num_rows_ub] = -highspy.kHighsInf
+        row_upper[:num_rows_ub] = np.asarray(bub, dtype=np.float64).ravel()
+    if num_rows_eq > 0:
+        beq = np.asarray(beq, dtype=np.float64).ravel()
+        row_lower[num_rows_ub:] = beq
+        row_upper[num_rows_ub:] = beq
+
+    h.changeRowsBoundsByRange(0, num_rows_ub + num_rows_eq - 1, row_lower, row_upper)
+    h.run()
+
+    if h.getModelStatus() == highspy.HighsModelStatus.kOptimal:
+        x = np.array(h.getSolution().col_value, dtype=np.float64)
+        return OptimizeResult(x=x, fun=h.getObjectiveValue(), success=True, status=0)
+    return OptimizeResult(x=None, fun=None, success=False, status=2)
+
+
+def apply(c: list, Aub: np.ndarray, bub: np.ndarray, Aeq: np.ndarray, beq: np.ndarray,
           parameters: Optional[Dict[Any, Any]] = None) -> OptimizeResult:
     if parameters is None:
         parameters = {}
 
     integrality = exec_utils.get_param_value(Parameters.INTEGRALITY, parameters, None)
-    sol = linprog(c, A_ub=Aub, b_ub=bub, A_eq=Aeq, b_eq=beq, method="revised simplex", integrality=integrality)
+    # dual simplex ("highs-ds") is the fastest HiGHS backend on the small LPs solved here
+    method = exec_utils.get_param_value(Parameters.LP_METHOD, parameters, "highs-ds")
+
+    # np.matrix is deprecated and carries per-operation Python overhead; coerce any
+    # matrix input coming from the callers once into plain 2-D arrays / 1-D vectors
+    c = np.asarray(c, dtype=np.float64).ravel()
+    Aub = None if Aub is None else (Aub if sparse.issparse(Aub) else np.asarray(Aub))
+    Aeq = None if Aeq is None else (Aeq if sparse.issparse(Aeq) else np.asarray(Aeq))
+    bub = None if bub is None else np.asarray(bub).ravel()
+    beq = None if beq is None else np.asarray(beq).ravel()
+
+    if (beq is None or not beq.any()) and (bub is None or not bub.any()) and (c >= 0).all():
+        # all right-hand sides are zero and the costs are non-negative, so the
+        # zero vector is optimal by inspection (it is also trivially integral);
+        # this covers the heuristic evaluations close to the final marking in
+        # the alignments A*, sidestepping the solver startup entirely
+        return OptimizeResult(x=np.zeros(len(c), dtype=np.float64), fun=0.0, success=True, status=0)
+
+    if method.startswith("highs"):
+        # the HiGHS methods accept (and exploit) sparse constraint matrices;
+        # the incidence matrices of Petri net alignments are extremely sparse
+        Aub = __to_csr(Aub)
+        Aeq = __to_csr(Aeq)
+
+    if integrality is not None:
+        # dispatch to the HiGHS branch-and-cut, bounding the MIP effort so the
+        # integrality-constrained problems (e.g. the extended marking-equation
+        # heuristic) return a good feasible solution quickly instead of spending
+        # the time on proving optimality
+        mip_rel_gap = exec_utils.get_param_value(Parameters.MIP_REL_GAP, parameters, 1e-4)
+        time_limit = exec_utils.get_param_value(Parameters.TIME_LIMIT, parameters, 5.0)
+        sol = linprog(c, A_ub=__to_csr(Aub), b_ub=bub, A_eq=__to_csr(Aeq), b_eq=beq, method="highs", integrality=integrality,
+                      options={"mip_rel_gap": mip_rel_gap, "time_limit": time_limit, "presolve": True})
+        return sol
+
+    if method.startswith("highs") and pkgutil.find_loader("highspy"):
+        # in the case highspy is installed (and no non-HiGHS method override is
+        # given), reuse the cached model for the structure of the problem
+        problem_key = exec_utils.get_param_value(Parameters.PROBLEM_KEY, parameters, None)
+        return __apply_highspy(c, Aub, bub, Aeq, beq, problem_key=problem_key)
+
+    sol = linprog(c, A_ub=Aub, b_ub=bub, A_eq=Aeq, b_eq=beq, method=method)
     return sol
 
 
 def get_prim_obj_from_sol(sol: OptimizeResult, parameters: Optional[Dict[Any, Any]] = None) -> int:
-    return round(sol.fun)
+    if sol is None or sol.fun is None:
+        # infeasible LP
+        return None
+    return int(np.rint(sol.fun))
 
 
 def get_points_from_sol(sol: OptimizeResult, parameters: Optional[Dict[Any, Any]] = None) -> List[int]:
-    return [round(y) for y in sol.x]
+    if sol is None or sol.x is None:
+        # infeasible LP
+        return None
+    return np.rint(sol.x).astype(np.int64).tolist()